@@ -1,12 +1,10 @@
+import numpy as np
+import streamlit as st
 from structural_columns import columns
 from handcalcs.decorator import handcalc
 
-CalcSteelColumn = columns.SteelColumn
-calc_renderer = handcalc()
-
-CalcSteelColumn.radius_of_gyration = calc_renderer(columns.SteelColumn.radius_of_gyration)
-
 
+@st.cache_data(max_entries=32)
 def compare_two_columns(
     min_height: int, 
     max_height: int,
@@ -40,79 +38,34 @@ def compare_two_columns(
     'i_y_b': Moment of interia about y-axis for columns section "b"
     'E_b': Elastic module for columns section "b"
     'fy_b': Yield strength for columns section "b"
-    """
-    x_values_a, y_values_a = column_pr_over_height_range(
-        min_height,
-        max_height,
-        interval,
-        "Column A",
-        area_a,
-        i_x_a,
-        i_y_a,
-        E_a,
-        fy_a
-    )
-    x_values_b, y_values_b = column_pr_over_height_range(
-        min_height,
-        max_height,
-        interval,
-        "Column B",
-        area_b,
-        i_x_b,
-        i_y_b,
-        E_b,
-        fy_b
-    )     
-    return {
-        "a": (x_values_a, y_values_a),
-        "b": (x_values_b, y_values_b),
-    }
-
-def column_pr_over_height_range(
-        min_height: int, 
-        max_height: int,
-        interval: int,
-        column_tag: str,
-        area: float, 
-        i_x: float, 
-        i_y: float,
-        E=200e3,
-        fy=350,
 
-) -> tuple[list[float], list[float], str]:
-    """
-    Returns a tuple containing a list of x-coordinates and a list of y-coordinates (respectively).
-    The x-coordinates represent height values ranging from 'min_height' to 'max_height' stepping by
-    the 'interval'.
-    The y-coordinates represent the factored axial resistance (Pr) of the column at each corresponding
-    height.
     The factored axial resistance is calculated according to CSA S16-15
 
     Assumptions:
-        * The column is pinned-pinned at the ends with an effective length of k * height
+        * The columns are pinned-pinned at the ends with an effective length of k * height
         where k == 1 in both x and y directions.
-        * The steel section being calculated is a doubly-symmetric hot-rolled section
+        * The steel sections being calculated are doubly-symmetric hot-rolled sections
     """
-    x_values = list(range(min_height, max_height, interval))
-    test_column = CalcSteelColumn(
-        height=min_height,
-        area=area,
-        Ix=i_x,
-        Iy=i_y,
-        kx=1,
-        ky=1,
-        E=E,
-        column_tag=column_tag,
-        fy=fy,
-        axial_loads=columns.Load(0, 0, 0, 0, 0),
+    x_values = np.arange(min_height, max_height, interval)
+    # Both sections are calculated together as columns of an (N, 2) array
+    y_values = columns.factored_axial_capacity_vec(
+        np.array([area_a, area_b]),
+        np.array([i_x_a, i_x_b]),
+        np.array([i_y_a, i_y_b]),
+        1,
+        1,
+        x_values[:, None],
+        np.array([E_a, E_b]),
+        np.array([fy_a, fy_b]),
+        1.34,
     )
-    y_values = []
-    for x_value in x_values:
-        test_column.height = x_value
-        pr = test_column.factored_axial_capacity(1.34)
-        y_values.append(pr)
-
-    return x_values, y_values
+    y_values_a = y_values[:, 0].tolist()
+    y_values_b = y_values[:, 1].tolist()
+    x_values = x_values.tolist()
+    return {
+        "a": (x_values, y_values_a),
+        "b": (x_values, y_values_b),
+    }
 
 
 # Example calcs with handcalcs
@@ -121,22 +74,33 @@ hc_renderer = handcalc(override='long')
 calc_euler_buckling = hc_renderer(columns.eulerbucklingload)
 calc_factored_resistance = hc_renderer(columns.factored_axial_capacity)
 
-def calc_pr_at_given_height(area: float, Ix: float, Iy: float, kx: float, ky: float, L: float, E: float, fy: float, n: float, phi=0.9):
+
+def calc_pr_value(area: float, Ix: float, Iy: float, kx: float, ky: float, L: float, E: float, fy: float, n: float, phi=0.9) -> float:
+    """
+    Returns the factored axial resistance of the column at the given height, 'L',
+    without rendering the calculation.
+    """
+    return columns.factored_axial_capacity_jit(area, Ix, Iy, kx, ky, L, E, fy, n, phi)
+
+
+@st.cache_data(max_entries=256)
+def calc_pr_latex(area: float, Ix: float, Iy: float, kx: float, ky: float, L: float, E: float, fy: float, n: float, phi=0.9) -> list[str]:
     """
-    Doc strings
+    Returns a list of the rendered LaTeX strings for the x-axis Euler buckling load,
+    the y-axis Euler buckling load, and the factored axial resistance of the column
+    at the given height, 'L'.
     """
     xbuckling_latex, _ = calc_euler_buckling(E, Ix, kx, L)
     ybuckling_latex, _ = calc_euler_buckling(E, Iy, ky, L)
-    factored_latex, factored_load = calc_factored_resistance(
-        area,
-        Ix,
-        Iy,
-        kx,
-        ky,
-        L,
-        E,
-        fy,
-        n,
-        phi
-        )
-    return [xbuckling_latex, ybuckling_latex, factored_latex], factored_load
+    factored_latex, _ = calc_factored_resistance(area, Ix, Iy, kx, ky, L, E, fy, n, phi)
+    return [xbuckling_latex, ybuckling_latex, factored_latex]
+
+
+def join_latex(latex_blocks: list[str]) -> str:
+    """
+    Returns a single LaTeX string that stacks each of the 'latex_blocks' in a
+    gathered environment so that they can be rendered with one call to st.latex.
+    The $$ delimiters that handcalcs wraps around each block are removed.
+    """
+    bodies = [block.strip().removeprefix("$$").removesuffix("$$").strip() for block in latex_blocks]
+    return "\\begin{gathered}\n" + " \\\\\n".join(bodies) + "\n\\end{gathered}"
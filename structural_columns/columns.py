@@ -5,8 +5,27 @@ A module for modelling columns in a variety of materials.
 from dataclasses import dataclass
 from math import pi, sqrt
 
+import numpy as np
 
-@dataclass
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python
+
+    def njit(*args, **kwargs):
+        """
+        Returns a decorator that leaves the decorated function unchanged.
+        """
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+PI_SQ = pi * pi
+
+
+@dataclass(slots=True, frozen=True)
 class Load:
     """
     A data type to represent any kind of scalar load as defined by the NBCC-19 separated
@@ -35,7 +54,11 @@ LD2 = Load(D=4.8, L=0, S=0, W=0, E=12.3)
 LD3 = Load(D=32.3, L=0, S=0, W=-10.3, E=0)
 
 
-@dataclass
+# Maps an axis name to its index in the (x, y) pairs of section properties
+_AXIS = {"x": 0, "y": 1}
+
+
+@dataclass(slots=True, frozen=True)
 class Column:
     """
     A data type to represent a theoretical doubly-symmetric column made of a (mostly)
@@ -58,22 +81,18 @@ class Column:
         Returns the calculated radius of gyration about the given axis.
         'axis', can be one of either "x" or "y"
         """
-        if axis.lower() == "x":
-            r = radius_of_gyration(self.Ix, self.area)
-        elif axis.lower() == "y":
-            r = radius_of_gyration(self.Iy, self.area)
-        return r
+        I = (self.Ix, self.Iy)[_AXIS[axis.lower()]]
+        return radius_of_gyration(I, self.area)
 
     def euler_buckling_load(self, axis: str) -> float:
         """
         Returns the calculated Euler buckling load about the given axis.
         'axis', can be one of either "x" or "y"
         """
-        if axis.lower() == "x":
-            P_E = eulerbucklingload(self.E, self.Ix, self.kx, self.height)
-        elif axis.lower() == "y":
-            P_E = eulerbucklingload(self.E, self.Iy, self.ky, self.height)
-        return P_E
+        axis_index = _AXIS[axis.lower()]
+        I = (self.Ix, self.Iy)[axis_index]
+        k = (self.kx, self.ky)[axis_index]
+        return eulerbucklingload(self.E, I, k, self.height)
 
 
 ## Examples
@@ -82,7 +101,7 @@ C01 = Column(4800, 120000, 1600e6, 900e6, 1, 1, 19.2)  # mm, MPa
 C02 = Column(160, 42.78, 1710.59, 679.91, 2.0, 1.0, 50.0)  # inch, ksi
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SteelColumn(Column):
     """
     A data type to represent a physical steel column that has loads applied.
@@ -195,13 +214,17 @@ def max_factored_load(load: Load) -> float:
     Current implementation only calculates factored loads for load
     combinations that include dead, live, and snow (no uplift)
     """
-    factored_loads = [
+    d125 = 1.25 * load.D
+    l15 = 1.5 * load.L
+    s15 = 1.5 * load.S
+    l10 = 1.0 * load.L
+    s10 = 1.0 * load.S
+    return max(
         1.4 * load.D,
-        1.25 * load.D + 1.5 * load.L,
-        1.25 * load.D + 1.5 * load.L + 1.0 * load.S,
-        1.25 * load.D + 1.5 * load.S + 1.0 * load.L,
-    ]
-    return max(factored_loads)
+        d125 + l15,
+        d125 + l15 + s10,
+        d125 + s15 + l10,
+    )
 
 
 def dl_str_to_load(dl_str: list[str]) -> Load:
@@ -227,7 +250,7 @@ def eulerbucklingload(E: float, I: float, k: float, L: float):
     """
     Calculates the Euler buckling load of a column
     """
-    P_E = (pi**2 * E * I) / (k * L**2)
+    P_E = (pi**2 * E * I) / (k * L) ** 2
     return P_E
 
 
@@ -248,3 +271,36 @@ def factored_axial_capacity(area: float,I_x: float,I_y: float,k_x: float,k_y: fl
     lamb = sqrt(f_y / F_e)
     P_r = phi * area * f_y * ((1 + lamb ** (2 * n)) ** (-1 / n))
     return P_r
+
+
+@njit(cache=True)
+def factored_axial_capacity_jit(area: float, I_x: float, I_y: float, k_x: float, k_y: float, L: float, E: float, f_y: float, n: float, phi=0.9) -> float:
+    """
+    Returns the same result as 'factored_axial_capacity' but compiled with numba
+    (when installed) for the scalar calculations that do not need to be rendered
+    by handcalcs.
+    """
+    F_e_x = PI_SQ * E * I_x / (k_x * L) ** 2 / area
+    F_e_y = PI_SQ * E * I_y / (k_y * L) ** 2 / area
+    F_e = min(F_e_x, F_e_y)
+    ratio = f_y / F_e
+    P_r = phi * area * f_y * ((1 + ratio**n) ** (-1 / n))
+    return P_r
+
+
+def factored_axial_capacity_vec(area: float, Ix: float, Iy: float, kx: float, ky: float, L_array: np.ndarray, E: float, fy: float, n: float, phi=0.9) -> np.ndarray:
+    """
+    Returns an array of the factored axial capacities calculated using CSA S16:19
+    in accordance with Cl. 13.3.1 about the governing axis, one for each column
+    length in 'L_array'.
+    This is the vectorized equivalent of 'factored_axial_capacity' and is intended
+    for generating capacities over a range of column heights. The section properties
+    may also be arrays to calculate several sections at once, provided that they
+    broadcast against 'L_array'.
+    """
+    P_E_x = PI_SQ * E * Ix / (kx * L_array) ** 2
+    P_E_y = PI_SQ * E * Iy / (ky * L_array) ** 2
+    F_e = np.minimum(P_E_x, P_E_y) / area
+    ratio = fy / F_e
+    P_r = phi * area * fy * (1 + ratio**n) ** (-1 / n)
+    return P_r